@@ -0,0 +1,14 @@
+"""Optional accelerated implementations of standard library modules."""
+
+from typing import TYPE_CHECKING
+
+# use the faster Intel ISA-L implementation of zlib when it is available
+if TYPE_CHECKING:
+    import zlib
+else:
+    try:
+        from isal import isal_zlib as zlib
+    except ImportError:
+        import zlib
+
+__all__ = ["zlib"]
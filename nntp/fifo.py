@@ -21,6 +21,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from typing_extensions import Self
 
 __all__ = ["BytesFifo", "Fifo", "TextFifo"]
@@ -93,6 +95,20 @@ class Fifo(Generic[T]):
         self.__discard()
         return data
 
+    def iterlines(self) -> Iterator[T]:
+        # all complete lines are split in one pass, each line is only consumed
+        # as it is yielded so the iterator may be abandoned part way through
+        self.__append()
+        i = self.buf.rfind(self.eol, self.pos)
+        if i < 0:
+            return
+        eol = self.eol
+        for line in self.buf[self.pos : i].split(eol):
+            line += eol
+            self.pos += len(line)
+            yield line
+        self.__discard()
+
     def readuntil(self, token: T, size: int = 0) -> tuple[bool, T]:
         self.__append()
         i = self.buf.find(token, self.pos)
@@ -19,13 +19,15 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
 from collections import OrderedDict
-from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
 from itertools import chain
 
 __all__ = ["HeaderDict"]
 
 
-class HeaderName(str):  # noqa: SLOT000
+class HeaderName(str):
+    __slots__ = ()
+
     def __eq__(self, other: object) -> bool:
         return isinstance(other, str) and self.casefold() == other.casefold()
 
@@ -34,6 +36,8 @@ class HeaderName(str):  # noqa: SLOT000
 
 
 class HeaderDict(MutableMapping[str, str]):
+    __slots__ = ("__proxy",)
+
     def __init__(
         self,
         other: Mapping[str, str] | Iterable[tuple[str, str]] | None = None,
@@ -55,6 +59,36 @@ class HeaderDict(MutableMapping[str, str]):
                 raise TypeError(f"Header value must be a string: {v!r}")
             self.__proxy[HeaderName(k)] = v
 
+    @classmethod
+    def factory(cls, names: Iterable[str]) -> Callable[[Iterable[str]], HeaderDict]:
+        """Create a function that builds HeaderDicts with a fixed set of names.
+
+        The header names are checked and prepared once, making this much
+        faster than the constructor when building many HeaderDicts with the
+        same headers, such as the rows of an overview response.
+
+        Args:
+            names: The header names.
+
+        Returns:
+            A function that takes an iterable of header values, in the same
+            order as the names, and returns a HeaderDict. The values are not
+            type checked and any values beyond the number of names are
+            ignored.
+        """
+        keys = []
+        for name in names:
+            if not isinstance(name, str):
+                raise TypeError(f"Header name must be a string: {name!r}")
+            keys.append(HeaderName(name))
+
+        def create(values: Iterable[str]) -> HeaderDict:
+            self = cls.__new__(cls)
+            self.__proxy = OrderedDict(zip(keys, values))
+            return self
+
+        return create
+
     def __getitem__(self, key: str) -> str:
         return self.__proxy[HeaderName(key)]
 
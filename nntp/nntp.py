@@ -22,12 +22,14 @@ import io
 import os
 import socket
 import ssl
-import zlib
+from collections import deque
 from datetime import datetime, timezone
 from functools import cached_property
+from itertools import islice
 from typing import TYPE_CHECKING, Literal
 
 from . import utils
+from ._compat import zlib
 from .fifo import BytesFifo
 from .headerdict import HeaderDict
 from .types import SSLMode
@@ -53,6 +55,13 @@ __all__ = [
 ]
 
 
+# maximum amount of data to inflate from a compressed response at a time
+_INFLATE_SIZE = 0x10000
+
+# size of the fixed part of a gzip header
+_GZIP_HEADER_SIZE = 10
+
+
 class NNTPError(Exception):
     """Base class for all NNTP errors."""
 
@@ -121,6 +130,11 @@ class BaseNNTPClient:
 
     encoding = "utf-8"
     errors = "surrogateescape"
+    recv_size = 65536
+    tcp_nodelay = True
+    keepalive = True
+    rcvbuf_size = 0
+    sndbuf_size = 0
 
     def __init__(
         self,
@@ -152,13 +166,28 @@ class BaseNNTPClient:
             NNTPReplyError: On bad response code from server.
         """
         self._buffer = BytesFifo()
+        self._recv_buffer = memoryview(bytearray(self.recv_size))
         self._generating = False
+        self._pipelined = 0
+        self._desynced = False
 
         self.username = username
         self.password = password
 
         # connect
         self.socket = socket.create_connection((host, port), timeout=timeout)
+        if self.tcp_nodelay:
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.keepalive:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if self.rcvbuf_size:
+            self.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf_size
+            )
+        if self.sndbuf_size:
+            self.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf_size
+            )
         if use_ssl and ssl_mode == SSLMode.IMPLICIT:
             self._enable_tls(host)
 
@@ -183,16 +212,37 @@ class BaseNNTPClient:
             server_hostname=host,
         )
 
-    def _recv(self, size: int = 4096) -> None:
+    def _recv(self) -> None:
         """Reads data from the socket.
 
+        Data is read into a preallocated buffer of recv_size bytes so that a
+        large multi-line response is read with few system calls and without
+        allocating a full sized bytes object for each read.
+
         Raises:
             NNTPError: When connection times out or read from socket fails.
         """
-        data = self.socket.recv(size)
-        if not data:
+        size = self.socket.recv_into(self._recv_buffer)
+        if not size:
             raise NNTPError("Failed to read from socket")
-        self._buffer.write(data)
+        self._buffer.write(self._recv_buffer[:size].tobytes())
+
+    def _readline(self) -> bytes:
+        """Reads a single line of data from the server.
+
+        It first attempts to read from the internal buffer. If there is not
+        enough data to read a line it then requests more data from the server
+        and adds it to the buffer. This process repeats until a line of data
+        can be read from the internal buffer.
+
+        Returns:
+            A line of data.
+        """
+        line = self._buffer.readline()
+        while not line:
+            self._recv()
+            line = self._buffer.readline()
+        return line
 
     def _line(self) -> Iterator[bytes]:
         """Generator that reads a line of data from the server.
@@ -202,15 +252,15 @@ class BaseNNTPClient:
         and adds it to the buffer. This process repeats until a line of data
         can be read from the internal buffer.
 
+        All of the complete lines in the internal buffer are split out at once
+        rather than searching for the end of each line in turn.
+
         Yields:
             A line of data when it becomes available.
         """
         while True:
-            line = self._buffer.readline()
-            if not line:
-                self._recv()
-                continue
-            yield line
+            yield from self._buffer.iterlines()
+            self._recv()
 
     def _buf(self, length: int = 0) -> Iterator[bytes]:
         """Generator that reads a block of data from the server.
@@ -255,7 +305,7 @@ class BaseNNTPClient:
         Returns:
             A tuple of status code and status message.
         """
-        line = next(self._line()).rstrip()
+        line = self._readline().rstrip()
         parts = line.split(None, 1)
 
         try:
@@ -297,11 +347,12 @@ class BaseNNTPClient:
         """
         self._generating = True
 
+        # only lines starting with a period need any further checks
         for line in self._line():
-            if line == b".\r\n":
-                break
             if line.startswith(b"."):
-                yield line[1:]
+                if line == b".\r\n":
+                    break
+                line = line[1:]
             yield line
 
         self._generating = False
@@ -336,26 +387,42 @@ class BaseNNTPClient:
 
         inflate = zlib.decompressobj(15 + 32)
 
+        # isal can't detect the format when given only part of the gzip header
+        while len(self._buffer.peek(_GZIP_HEADER_SIZE)) < _GZIP_HEADER_SIZE:
+            self._recv()
+
         done, buf = False, BytesFifo()
-        while not done:
-            try:
-                data = inflate.decompress(next(self._buf()))
-            except zlib.error:
-                raise NNTPDataError("Decompression failed")
-            if data:
-                buf.write(data)
-            if inflate.unused_data:
-                buf.write(inflate.unused_data)
-            for line in buf:
-                if line == b".\r\n":
-                    done = True
+        while not inflate.eof:
+            data = next(self._buf())
+            while True:
+                try:
+                    inflated = inflate.decompress(data, _INFLATE_SIZE)
+                except zlib.error:
+                    raise NNTPDataError("Decompression failed")
+                # past the terminator only the gzip trailer is left to consume
+                if not done:
+                    buf.write(inflated)
+                    for line in buf.iterlines():
+                        if line.startswith(b"."):
+                            if line == b".\r\n":
+                                done = True
+                                break
+                            line = line[1:]
+                        yield line
+                # output can still be pending once all of the input is consumed
+                data = inflate.unconsumed_tail
+                if inflate.eof or (not data and len(inflated) < _INFLATE_SIZE):
                     break
-                if line.startswith(b"."):
-                    yield line[1:]
-                yield line
+
+        # data following the compressed data belongs to the plain stream
+        self._buffer.write(inflate.unused_data + self._buffer.read())
 
         self._generating = False
 
+        # terminating line follows the compressed data
+        if not done:
+            yield from self._info_plain()
+
     def _info_yenczlib(self) -> Iterator[bytes]:
         """Generator for the lines of a compressed info (textual) response.
 
@@ -383,25 +450,26 @@ class BaseNNTPClient:
         inflate = zlib.decompressobj(-15)
 
         # header
-        header = next(self._info_plain())
+        header = self._readline()
         if not header.startswith(b"=ybegin"):
             raise NNTPDataError("Bad yEnc header")
 
         # data
+        decode, decompress = decoder.decode, inflate.decompress
         buf, trailer = BytesFifo(), b""
         for line in self._info_plain():
             if line.startswith(b"=yend"):
                 trailer = line
                 continue
-            data = decoder.decode(line)
+            data = decode(line)
             try:
-                data = inflate.decompress(data)
+                data = decompress(data)
             except zlib.error:
                 raise NNTPDataError("Decompression failed")
             if not data:
                 continue
             buf.write(data)
-            yield from buf
+            yield from buf.iterlines()
 
         # trailer
         if not trailer:
@@ -448,8 +516,103 @@ class BaseNNTPClient:
         Yields:
             A line of the info response as a string.
         """
+        encoding, errors = self.encoding, self.errors
         for line in self._info(code, message, yz):
-            yield line.decode(self.encoding, self.errors)
+            yield line.decode(encoding, errors)
+
+    def _reply(self) -> tuple[int, str]:
+        """Reads a command response status without raising on error statuses.
+
+        Returns:
+            A tuple of status code and status message.
+        """
+        try:
+            return self.status()
+        except NNTPReplyError as e:
+            return e.code, e.message
+
+    def _encode_command(self, verb: str, args: str | None = None) -> bytes:
+        cmd = f"{verb} {args}\r\n" if args else f"{verb}\r\n"
+        return cmd.encode(self.encoding)
+
+    def pipeline(
+        self,
+        commands: Iterable[tuple[str, str | None]],
+        depth: int = 16,
+    ) -> Iterator[tuple[int, str]]:
+        """Generator that pipelines commands to the server.
+
+        The first command is issued with command() so that authentication is
+        handled as usual. The remaining commands are written to the server
+        without waiting for the response to the previous command, keeping up
+        to depth commands outstanding at any one time.
+
+        Response statuses are yielded in the order the commands were given.
+        The body of a multi-line response must be consumed (using info())
+        before the generator is advanced.
+
+        Args:
+            commands: An iterable of verb, args tuples as given to command().
+            depth: The maximum number of commands to have outstanding.
+
+        Yields:
+            A tuple of status code and status message for each command. Error
+            statuses are yielded rather than raised so that the responses to
+            the commands that follow can still be read.
+
+        Raises:
+            ValueError: If depth is less than 1.
+
+        Note:
+            Pipelining is defined by RFC3977. Only use this with servers that
+            support it (see NNTPClient.pipelining).
+
+        Note:
+            If the generator is not run to completion the responses to the
+            remaining commands are never read and any further command issued on
+            the connection raises NNTPSyncError. The same applies if an error
+            is raised while the responses are being read.
+        """
+        if depth < 1:
+            raise ValueError("Pipeline depth must be at least 1")
+
+        commands = iter(commands)
+
+        first = next(commands, None)
+        if first is None:
+            return
+
+        try:
+            code, message = self.command(*first)
+        except NNTPReplyError as e:
+            code, message = e.code, e.message
+        yield code, message
+
+        if self._generating:
+            raise NNTPSyncError("Command issued while a generator is active")
+
+        window = [self._encode_command(*cmd) for cmd in islice(commands, depth)]
+
+        try:
+            self.socket.sendall(b"".join(window))
+
+            # responses still to be read, commands are refused until this is zero
+            self._pipelined = len(window)
+            while self._pipelined:
+                if self._generating:
+                    raise NNTPSyncError("Command issued while a generator is active")
+                reply = self._reply()
+                self._pipelined -= 1
+                yield reply
+                for cmd in islice(commands, 1):
+                    self.socket.sendall(self._encode_command(*cmd))
+                    self._pipelined += 1
+        except GeneratorExit:
+            raise
+        except BaseException:
+            # the remaining responses can no longer be matched to their commands
+            self._desynced = True
+            raise
 
     def command(self, verb: str, args: str | None = None) -> tuple[int, str]:
         """Call a command on the server.
@@ -477,24 +640,39 @@ class BaseNNTPClient:
         """
         if self._generating:
             raise NNTPSyncError("Command issued while a generator is active")
+        if self._desynced:
+            raise NNTPSyncError("Command issued after a pipeline failed")
+        if self._pipelined:
+            raise NNTPSyncError("Command issued while pipelined responses are pending")
 
-        cmd = f"{verb} {args}\r\n" if args else f"{verb}\r\n"
-
-        self.socket.sendall(cmd.encode(self.encoding))
+        data = self._encode_command(verb, args)
+        self.socket.sendall(data)
 
         try:
-            code, message = self.status()
+            return self.status()
         except NNTPTemporaryError as e:
             if e.code != 480:
                 raise
-            code, message = self.command("AUTHINFO USER", self.username)
-            if code == 381:
-                code, message = self.command("AUTHINFO PASS", self.password)
-            if code != 281:
-                raise NNTPReplyError(code, message)
-            code, message = self.command(verb, args)
 
-        return code, message
+        # authenticate and then replay the command
+        self._authinfo()
+        self.socket.sendall(data)
+
+        return self.status()
+
+    def _authinfo(self) -> None:
+        """Authenticates using the username and password of the client.
+
+        Raises:
+            NNTPReplyError: If authentication fails.
+        """
+        self.socket.sendall(self._encode_command("AUTHINFO USER", self.username))
+        code, message = self.status()
+        if code == 381:
+            self.socket.sendall(self._encode_command("AUTHINFO PASS", self.password))
+            code, message = self.status()
+        if code != 281:
+            raise NNTPReplyError(code, message)
 
     def close(self) -> None:
         """Closes the connection at the client.
@@ -675,7 +853,10 @@ class NNTPClient(BaseNNTPClient):
         if code != 111:
             raise NNTPReplyError(code, message)
 
-        return utils.parse_date(message)
+        try:
+            return utils.parse_date(message)
+        except ValueError:
+            raise NNTPDataError("Invalid DATE status")
 
     def help(self) -> str:
         """HELP command.
@@ -712,14 +893,7 @@ class NNTPClient(BaseNNTPClient):
         Note: If the datetime object supplied as the timestamp is naive (tzinfo
             is None) then it is assumed to be given as GMT.
         """
-        if timestamp.tzinfo:
-            ts = timestamp.astimezone(timezone.utc)
-        else:
-            ts = timestamp.replace(tzinfo=timezone.utc)
-
-        args = ts.strftime("%Y%m%d %H%M%S %Z")
-
-        code, message = self.command("NEWGROUPS", args)
+        code, message = self.command("NEWGROUPS", utils.unparse_date(timestamp))
         if code != 231:
             raise NNTPReplyError(code, message)
 
@@ -746,13 +920,7 @@ class NNTPClient(BaseNNTPClient):
             is None) then it is assumed to be given as GMT. If tzinfo is set
             then it will be converted to GMT by this function.
         """
-        if timestamp.tzinfo:
-            ts = timestamp.astimezone(timezone.utc)
-        else:
-            ts = timestamp.replace(tzinfo=timezone.utc)
-
-        args = pattern
-        args += " " + ts.strftime("%Y%m%d %H%M%S %Z")
+        args = pattern + " " + utils.unparse_date(timestamp)
 
         code, message = self.command("NEWNEWS", args)
         if code != 230:
@@ -1167,7 +1335,7 @@ class NNTPClient(BaseNNTPClient):
 
         yz = verb == "XZHDR"
         for line in self.info(code, message, yz=yz):
-            parts = line.split(None, 1)
+            parts = line.rstrip().split(None, 1)
             try:
                 articleno = int(parts[0])
                 value = parts[1] if len(parts) > 1 else ""
@@ -1243,14 +1411,59 @@ class NNTPClient(BaseNNTPClient):
                 "Lines",
             )
 
+    @cached_property
+    def pipelining(self) -> bool:
+        """Whether the server supports command pipelining.
+
+        Pipelining is part of RFC3977 so any server that implements the
+        CAPABILITIES command is assumed to support it.
+        """
+        try:
+            deque(self.capabilities(), maxlen=0)
+        except NNTPError:
+            return False
+        return True
+
+    def _overview(
+        self,
+        lines: Iterator[bytes],
+        fmt: tuple[str, ...],
+        verb: str,
+        limit: int | None = None,
+    ) -> Iterator[tuple[int, HeaderDict]]:
+        # article number plus the known fields, anything extra is left unsplit
+        maxsplit = len(fmt) + 1
+
+        encoding, errors = self.encoding, self.errors
+        create = HeaderDict.factory(fmt)
+        for line in islice(lines, limit):
+            parts = line.decode(encoding, errors).rstrip().split("\t", maxsplit)
+            try:
+                articleno = int(parts[0])
+                overview = create(parts[1:])
+            except (IndexError, ValueError):
+                raise NNTPDataError(f"Invalid {verb} response")
+            yield articleno, overview
+
+        # there is no way to cancel a response, discard anything past the limit
+        deque(lines, maxlen=0)
+
     def _xover(
         self,
         range: Range | None = None,
         verb: str = "XOVER",
+        limit: int | None = None,
     ) -> Iterator[tuple[int, HeaderDict]]:
-        # get overview fmt before entering generator
+        # get overview fmt before issuing the command
         fmt = self.overview_fmt
 
+        yield from self._overview(self._xover_raw(range, verb), fmt, verb, limit)
+
+    def _xover_raw(
+        self,
+        range: Range | None = None,
+        verb: str = "XOVER",
+    ) -> Iterator[bytes]:
         args = None
         if range is not None:
             args = utils.unparse_range(range)
@@ -1259,19 +1472,44 @@ class NNTPClient(BaseNNTPClient):
         if code != 224:
             raise NNTPReplyError(code, message)
 
+        yield from self._info(code, message, yz=verb == "XZVER")
+
+    def _xover_multi(
+        self,
+        ranges: Iterable[Range],
+        verb: str = "XOVER",
+    ) -> Iterator[tuple[int, HeaderDict]]:
+        # an invalid range must be found before any of the commands are issued
+        ranges = list(ranges)
+        commands = [(verb, utils.unparse_range(r)) for r in ranges]
+
+        # get overview fmt and pipelining support before issuing the commands
+        fmt = self.overview_fmt
+
+        if not self.pipelining:
+            for article_range in ranges:
+                yield from self._xover(article_range, verb)
+            return
+
         yz = verb == "XZVER"
-        for line in self.info(code, message, yz=yz):
-            parts = line.rstrip().split("\t")
-            try:
-                articleno = int(parts[0])
-                overview = HeaderDict(zip(fmt, parts[1:]))
-            except (IndexError, ValueError):
-                raise NNTPDataError(f"Invalid {verb} response")
-            yield articleno, overview
+        error = None
+        for code, message in self.pipeline(commands):
+            if code != 224:
+                error = error or NNTPReplyError(code, message)
+                continue
+            lines = self._info(code, message, yz=yz)
+            if error:
+                deque(lines, maxlen=0)
+                continue
+            yield from self._overview(lines, fmt, verb)
+
+        if error:
+            raise error
 
     def xover(
         self,
         range: Range | None = None,
+        limit: int | None = None,
     ) -> Iterator[tuple[int, HeaderDict]]:
         """XOVER command.
 
@@ -1285,6 +1523,10 @@ class NNTPClient(BaseNNTPClient):
                 range of article numbers in the form (first, [last]). If last
                 is omitted then all articles after first are included. A range
                 of None (the default) uses the current article.
+            limit: The maximum number of articles to yield. The remainder of
+                the response is still read from the server but is discarded
+                without being parsed. A limit of None (the default) yields all
+                articles.
 
         Yields:
             A 2-tuple of the article number and a dictionary of the fields as
@@ -1298,17 +1540,82 @@ class NNTPClient(BaseNNTPClient):
             NNTPReplyError: If no such article exists or the currently selected
                 newsgroup is invalid.
         """
-        return self._xover(range)
+        return self._xover(range, limit=limit)
 
     def xzver(
         self,
         range: Range | None = None,
+        limit: int | None = None,
     ) -> Iterator[tuple[int, HeaderDict]]:
         """XZVER command.
 
         The compressed version of XHDR. See xover().
         """
-        return self._xover(range, verb="XZVER")
+        return self._xover(range, verb="XZVER", limit=limit)
+
+    def xover_raw(self, range: Range | None = None) -> Iterator[bytes]:
+        """XOVER command returning the undecoded overview lines.
+
+        Useful when the overview data is to be stored, forwarded or hashed
+        rather than examined, as no decoding or splitting into fields is done.
+
+        Args:
+            range: An article range as specified by xover().
+
+        Yields:
+            Each line of the overview response as bytes, including the line
+            terminator.
+
+        Raises:
+            NNTPReplyError: If no such article exists or the currently selected
+                newsgroup is invalid.
+        """
+        return self._xover_raw(range)
+
+    def xzver_raw(self, range: Range | None = None) -> Iterator[bytes]:
+        """XZVER command returning the undecoded overview lines.
+
+        The compressed version of XOVER. See xover_raw().
+        """
+        return self._xover_raw(range, verb="XZVER")
+
+    def xover_multi(
+        self,
+        ranges: Iterable[Range],
+    ) -> Iterator[tuple[int, HeaderDict]]:
+        """XOVER command for multiple ranges.
+
+        Issues an XOVER command for each of the ranges, pipelining the
+        commands if the server supports it so that the round trip for each
+        range is not waited on before the next range is requested.
+
+        Args:
+            ranges: An iterable of ranges in any of the forms accepted by
+                xover(), except for None.
+
+        Yields:
+            A 2-tuple of the article number and a dictionary of the fields, as
+            per xover(), for each of the ranges in the order given.
+
+        Raises:
+            NNTPReplyError: If the request for any of the ranges fails. The
+                error is raised once the responses to all of the outstanding
+                commands have been read, articles from ranges following the
+                failed range are not yielded.
+            ValueError: If any of the ranges is invalid. No commands are issued
+                in that case.
+        """
+        return self._xover_multi(ranges)
+
+    def xzver_multi(
+        self,
+        ranges: Iterable[Range],
+    ) -> Iterator[tuple[int, HeaderDict]]:
+        """XZVER command for multiple ranges.
+
+        The compressed version of xover_multi(). See xover_multi().
+        """
+        return self._xover_multi(ranges, verb="XZVER")
 
     def xpat(
         self,
@@ -1337,14 +1644,39 @@ class NNTPClient(BaseNNTPClient):
         Raises:
             NNTPReplyError: If no such article exists.
         """
-        args = " ".join([header, utils.unparse_msgid_range(msgid_range), *pattern])
+        encoding, errors = self.encoding, self.errors
+        for line in self.xpat_raw(header, msgid_range, *pattern):
+            yield line.decode(encoding, errors).strip()
+
+    def xpat_raw(
+        self,
+        header: str,
+        msgid_range: str | Range,
+        *pattern: str,
+    ) -> Iterator[bytes]:
+        """XPAT command returning the undecoded lines.
+
+        Useful when the matched headers are to be stored, forwarded or hashed
+        rather than examined, as no decoding or stripping is done.
+
+        Args:
+            header: The header field to match against.
+            msgid_range: An article range as specified by xpat().
+
+        Yields:
+            Each line of the XPAT response as bytes, including the line
+            terminator.
+
+        Raises:
+            NNTPReplyError: If no such article exists.
+        """
+        args = " ".join((header, utils.unparse_msgid_range(msgid_range), *pattern))
 
         code, message = self.command("XPAT", args)
         if code != 221:
             raise NNTPReplyError(code, message)
 
-        for line in self.info(code, message):
-            yield line.strip()
+        yield from self._info(code, message)
 
     def xfeature_compress_gzip(self, terminator: bool = False) -> bool:
         """XFEATURE COMPRESS GZIP command."""
@@ -1448,6 +1780,7 @@ class NNTPClient(BaseNNTPClient):
 # testing
 # TODO: Remove/move this to a test file
 if __name__ == "__main__":
+    import hashlib
     import sys
     from datetime import timedelta
 
@@ -1490,8 +1823,7 @@ if __name__ == "__main__":
         log("NEWGROUPS\n")
         try:
             for newsgroup in nntp_client.newgroups(now - fiftydays):
-                print(newsgroup)
-                # log('%s\n' % newsgroup)  # noqa: ERA001
+                log(f"{newsgroup}\n")
         except NNTPError as e:
             log(f"{e}\n")
         log("\n")
@@ -1575,25 +1907,23 @@ if __name__ == "__main__":
 
         log(f"XOVER {last - 10}-{last}\n")
         try:
-            hash_ = count = 0
-            for article, overview in nntp_client.xover((last - 10, last)):
-                log(f"{article} {overview}\n")
-                hash_ += sum(map(hash, overview.keys()))
-                hash_ += sum(map(hash, overview.values()))
+            digest, count = hashlib.blake2b(digest_size=16), 0
+            for line in nntp_client.xover_raw((last - 10, last)):
+                log(line.decode(errors="replace"))
+                digest.update(line)
                 count += 1
-            log(f"Entries {count} Hash {hash_}\n")
+            log(f"Entries {count} Hash {digest.hexdigest()}\n")
         except NNTPError as e:
             log(f"{e}\n")
         log("\n")
 
         log(f"XZVER {last - 10}-{last}\n")
         try:
-            hash_ = count = 0
-            for _article, overview in nntp_client.xzver((last - 10, last)):
-                hash_ += sum(map(hash, overview.keys()))
-                hash_ += sum(map(hash, overview.values()))
+            digest, count = hashlib.blake2b(digest_size=16), 0
+            for line in nntp_client.xzver_raw((last - 10, last)):
+                digest.update(line)
                 count += 1
-            log(f"Entries {count} Hash {hash_}\n")
+            log(f"Entries {count} Hash {digest.hexdigest()}\n")
         except NNTPError as e:
             log(f"{e}\n")
         log("\n")
@@ -1607,12 +1937,11 @@ if __name__ == "__main__":
 
         log(f"XOVER {last - 10}-{last}\n")
         try:
-            hash_ = count = 0
-            for _article, overview in nntp_client.xover((last - 10, last)):
-                hash_ += sum(map(hash, overview.keys()))
-                hash_ += sum(map(hash, overview.values()))
+            digest, count = hashlib.blake2b(digest_size=16), 0
+            for line in nntp_client.xover_raw((last - 10, last)):
+                digest.update(line)
                 count += 1
-            log(f"Entries {count} Hash {hash_}\n")
+            log(f"Entries {count} Hash {digest.hexdigest()}\n")
         except NNTPError as e:
             log(f"{e}\n")
         log("\n")
@@ -1626,12 +1955,11 @@ if __name__ == "__main__":
 
         log(f"XOVER {last - 10}-{last}\n")
         try:
-            hash_ = count = 0
-            for _article, overview in nntp_client.xover((last - 10, last)):
-                hash_ += sum(map(hash, overview.keys()))
-                hash_ += sum(map(hash, overview.values()))
+            digest, count = hashlib.blake2b(digest_size=16), 0
+            for line in nntp_client.xover_raw((last - 10, last)):
+                digest.update(line)
                 count += 1
-            log(f"Entries {count} Hash {hash_}\n")
+            log(f"Entries {count} Hash {digest.hexdigest()}\n")
         except NNTPError as e:
             log(f"{e}\n")
         log("\n")
@@ -1669,7 +1997,7 @@ if __name__ == "__main__":
         try:
             log(f"Entries {len(list(nntp_client.list('NEWSGROUPS')))}\n")
             for group in nntp_client.list("NEWSGROUPS"):
-                print(group)
+                log(group)
         except NNTPError as e:
             log(f"{e}\n")
         log("\n")
@@ -211,6 +211,25 @@ def parse_date(value: str | int) -> datetime:
     return datetime(Y % 10000, m, d, H, M, S, tzinfo=timezone.utc)
 
 
+def unparse_date(obj: datetime) -> str:
+    """Unparse a date argument.
+
+    Args:
+        obj: A datetime object. If it is naive (tzinfo is None) then it is
+            assumed to be given as GMT, otherwise it is converted to GMT.
+
+    Returns:
+        The date as a string in the format `YYYYMMDD HHMMSS GMT` that can be
+        used by the `NEWGROUPS` and `NEWNEWS` commands.
+    """
+    if obj.tzinfo:
+        obj = obj.astimezone(timezone.utc)
+    return (
+        f"{obj.year:04d}{obj.month:02d}{obj.day:02d} "
+        f"{obj.hour:02d}{obj.minute:02d}{obj.second:02d} GMT"
+    )
+
+
 def parse_epoch(value: str | int) -> datetime:
     """Parse a date as returned by the `DATE` command.
 
@@ -18,24 +18,28 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
-import binascii
 import re
-import struct
-import zlib
+
+from ._compat import zlib
 
 __all__ = ["YEnc", "trailer_crc32"]
 
 
 _crc32_re = re.compile(b"\\s+crc(?:32)?=([0-9a-fA-F]{8})")
 
+# translation table for decoding unescaped characters
+_decode_table = bytes((i - 42) & 0xFF for i in range(256))
+
+# escaped characters are offset by a further 64, undo that before translating
+_unescape = [bytes(((i - 64) & 0xFF,)) for i in range(256)]
+
 
 def trailer_crc32(trailer: bytes) -> int | None:
     """Extract the CRC32 value from a yEnc trailer."""
     match = _crc32_re.search(trailer)
     if not match:
         return None
-    buf = binascii.unhexlify(match.group(1))
-    return struct.unpack(">I", buf)[0]  # type: ignore[no-any-return]
+    return int(match.group(1), 16)
 
 
 class YEnc:
@@ -49,6 +53,29 @@ class YEnc:
         self._escape = 0
 
     def decode(self, buf: bytes) -> bytes:
+        data = buf.translate(None, b"\r\n")
+        if self._escape:
+            data = b"=" + data
+            self._escape = 0
+
+        # escaping the escape character itself is legal but never done by
+        # encoders in practice, fall back to decoding byte by byte for it
+        if b"==" in data:
+            decoded = self._decode(data)
+        else:
+            head, *escaped = data.split(b"=")
+            if escaped and not escaped[-1]:
+                self._escape = 1
+                escaped.pop()
+            chunks = [head]
+            for part in escaped:
+                chunks += (_unescape[part[0]], part[1:])
+            decoded = b"".join(chunks).translate(_decode_table)
+
+        self.crc32 = zlib.crc32(decoded, self.crc32)
+        return decoded
+
+    def _decode(self, buf: bytes) -> bytes:
         data = bytearray()
         for b in buf:
             if self._escape:
@@ -62,6 +89,4 @@ class YEnc:
             else:
                 b = (b - 42) & 0xFF
             data.append(b)
-        decoded = bytes(data)
-        self.crc32 = zlib.crc32(decoded, self.crc32)
-        return decoded
+        return bytes(data)
@@ -137,3 +137,72 @@ def test_article(newsgroup: str) -> None:
         assert headers["Newsgroups"] == newsgroup
         assert headers["Subject"] == f"Test post to {newsgroup}"
         assert body == f"This is a test post to {newsgroup}\r\n".encode()
+
+
+def test_xover_limit() -> None:
+    with nntp.NNTPClient("localhost") as nntp_client:
+        nntp_client.group("local.test")
+        assert list(nntp_client.xover((1,), limit=0)) == []
+        articles = list(nntp_client.xover((1,), limit=1))
+        assert [article_number for article_number, _ in articles] == [1]
+        assert articles[0][1]["Subject"] == "Test post to local.test"
+
+
+def test_xover_multi() -> None:
+    with nntp.NNTPClient("localhost") as nntp_client:
+        nntp_client.group("local.test")
+        expected = list(nntp_client.xover((1,)))
+        assert list(nntp_client.xover_multi([(1,), (1,), (1,)])) == expected * 3
+        assert nntp_client.group("local.test")[3] == "local.test"
+
+
+def test_xhdr() -> None:
+    with nntp.NNTPClient("localhost") as nntp_client:
+        nntp_client.group("local.test")
+        assert list(nntp_client.xhdr("Subject", (1,))) == [
+            (1, "Test post to local.test")
+        ]
+
+
+def test_xover_raw() -> None:
+    with nntp.NNTPClient("localhost") as nntp_client:
+        nntp_client.group("local.test")
+        lines = list(nntp_client.xover_raw((1,)))
+        assert len(lines) == 1
+        assert lines[0].startswith(b"1\tTest post to local.test\t")
+        assert lines[0].endswith(b"\r\n")
+
+
+def test_xpat_raw() -> None:
+    with nntp.NNTPClient("localhost") as nntp_client:
+        nntp_client.group("local.test")
+        lines = list(nntp_client.xpat_raw("Subject", (1,), "*local.test"))
+        assert lines == [b"1 Test post to local.test\r\n"]
+        assert list(nntp_client.xpat("Subject", (1,), "*local.test")) == [
+            "1 Test post to local.test"
+        ]
+
+
+def test_pipeline() -> None:
+    with nntp.NNTPClient("localhost") as nntp_client:
+        commands = [("GROUP", "local.test"), ("XOVER", "1-"), ("STAT", "1")]
+        replies = []
+        for code, message in nntp_client.pipeline(commands):
+            replies.append(code)
+            if code == 224:
+                assert len(list(nntp_client.info(code, message))) == 1
+        assert replies == [211, 224, 223]
+
+
+def test_dot_stuffing() -> None:
+    headers = {
+        "Subject": "Test dot stuffing",
+        "From": "GitHub Actions <actions@github.com>",
+        "Newsgroups": "local.general",
+    }
+    with nntp.NNTPClient("localhost") as nntp_client:
+        assert nntp_client.post(headers=headers, body="one\n.two\n..three\n")
+        _, _, last, _ = nntp_client.group("local.general")
+        expected = b"one\r\n.two\r\n..three\r\n"
+        assert nntp_client.body(last) == expected
+        assert nntp_client.article(last)[2] == expected
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from itertools import islice
+
+import pytest
+
+from nntp.fifo import BytesFifo, TextFifo
+
+
+@pytest.mark.parametrize(
+    ("chunks", "expected", "remaining"),
+    [
+        ([], [], b""),
+        ([b"partial"], [], b"partial"),
+        ([b"one\r\n"], [b"one\r\n"], b""),
+        ([b"one\r\ntwo\r", b"\nthr"], [b"one\r\n", b"two\r\n"], b"thr"),
+        ([b"\r\n\r\n"], [b"\r\n", b"\r\n"], b""),
+        ([b"a\rb\nc\r\n"], [b"a\rb\nc\r\n"], b""),
+    ],
+)
+def test_iterlines(
+    chunks: list[bytes], expected: list[bytes], remaining: bytes
+) -> None:
+    fifo = BytesFifo()
+    for chunk in chunks:
+        fifo.write(chunk)
+    assert list(fifo.iterlines()) == expected
+    assert fifo.read() == remaining
+
+
+def test_iterlines_matches_readline() -> None:
+    data = "".join(f"line {i}\r\n" for i in range(0x4000)) + "tail"
+    fifo, other = TextFifo(data), TextFifo(data)
+    assert list(fifo.iterlines()) == list(other)
+    assert fifo.read() == other.read() == "tail"
+
+
+def test_iterlines_partial() -> None:
+    fifo = BytesFifo(b"one\r\ntwo\r\nthree\r\n")
+    assert list(islice(fifo.iterlines(), 2)) == [b"one\r\n", b"two\r\n"]
+    assert fifo.readline() == b"three\r\n"
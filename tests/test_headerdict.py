@@ -1,3 +1,5 @@
+import copy
+
 from nntp.headerdict import HeaderDict
 
 
@@ -64,3 +66,19 @@ def test_repr() -> None:
     header_dict = HeaderDict()
     header_dict["key"] = "value"
     assert repr(header_dict) == "HeaderDict([('key', 'value')])"
+
+
+def test_copy() -> None:
+    header_dict = HeaderDict()
+    header_dict["KeYMiXeD"] = "value"
+    assert copy.copy(header_dict) == header_dict
+    assert copy.deepcopy(header_dict)["keymixed"] == "value"
+
+
+def test_factory() -> None:
+    create = HeaderDict.factory(["Subject", "From"])
+    header_dict = create(["subject", "from", "extra"])
+    assert header_dict == {"SUBJECT": "subject", "from": "from"}
+    assert list(header_dict) == ["Subject", "From"]
+    header_dict["subject"] = "changed"
+    assert create(["subject"]) == {"Subject": "subject"}
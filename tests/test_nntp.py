@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import gzip
+from collections import deque
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from nntp.nntp import (
+    BaseNNTPClient,
+    NNTPClient,
+    NNTPProtocolError,
+    NNTPSyncError,
+    NNTPTemporaryError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class FakeSocket:
+    """Socket that records what is sent and replays canned server data."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self.chunks = deque(chunks)
+        self.sent = b""
+
+    def setsockopt(self, *args: int) -> None:
+        pass
+
+    def sendall(self, data: bytes) -> None:
+        self.sent += data
+
+    def recv_into(self, buffer: memoryview) -> int:
+        if not self.chunks:
+            return 0
+        data = self.chunks.popleft()
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def connect() -> Iterator[mock.MagicMock]:
+    with mock.patch("socket.create_connection") as create_connection:
+        yield create_connection
+
+
+def client(connect: mock.MagicMock, *chunks: bytes) -> BaseNNTPClient:
+    connect.return_value = FakeSocket([b"200 ready\r\n", *chunks])
+    return BaseNNTPClient("localhost")
+
+
+def auth_client(connect: mock.MagicMock, *chunks: bytes) -> BaseNNTPClient:
+    connect.return_value = FakeSocket([b"200 ready\r\n", *chunks])
+    return BaseNNTPClient("localhost", username="user", password="pass")  # noqa: S106
+
+
+def test_command_auth(connect: mock.MagicMock) -> None:
+    nntp_client = auth_client(
+        connect,
+        b"480 authentication required\r\n",
+        b"381 password required\r\n",
+        b"281 ok\r\n",
+        b"211 1 1 1 a\r\n",
+    )
+    assert nntp_client.command("GROUP", "a") == (211, "1 1 1 a")
+    assert connect.return_value.sent == (
+        b"GROUP a\r\nAUTHINFO USER user\r\nAUTHINFO PASS pass\r\nGROUP a\r\n"
+    )
+
+
+def test_command_auth_user_only(connect: mock.MagicMock) -> None:
+    nntp_client = auth_client(
+        connect,
+        b"480 authentication required\r\n",
+        b"281 ok\r\n",
+        b"211 1 1 1 a\r\n",
+    )
+    assert nntp_client.command("GROUP", "a") == (211, "1 1 1 a")
+    assert connect.return_value.sent == (
+        b"GROUP a\r\nAUTHINFO USER user\r\nGROUP a\r\n"
+    )
+
+
+def test_command_auth_failed(connect: mock.MagicMock) -> None:
+    nntp_client = auth_client(
+        connect,
+        b"480 authentication required\r\n",
+        b"381 password required\r\n",
+        b"481 authentication failed\r\n",
+    )
+    with pytest.raises(NNTPTemporaryError) as e:
+        nntp_client.command("GROUP", "a")
+    assert e.value.code == 481
+    assert connect.return_value.sent == (
+        b"GROUP a\r\nAUTHINFO USER user\r\nAUTHINFO PASS pass\r\n"
+    )
+
+
+def test_command_auth_required_again(connect: mock.MagicMock) -> None:
+    nntp_client = auth_client(
+        connect,
+        b"480 authentication required\r\n",
+        b"281 ok\r\n",
+        b"480 authentication required\r\n",
+    )
+    with pytest.raises(NNTPTemporaryError) as e:
+        nntp_client.command("GROUP", "a")
+    assert e.value.code == 480
+    assert connect.return_value.sent == (
+        b"GROUP a\r\nAUTHINFO USER user\r\nGROUP a\r\n"
+    )
+
+
+def test_pipeline(connect: mock.MagicMock) -> None:
+    nntp_client = client(
+        connect,
+        b"211 1 1 1 a\r\n",
+        b"411 no such group\r\n211 1 1 1 c\r\n",
+    )
+    commands = [("GROUP", "a"), ("GROUP", "bad"), ("GROUP", "c")]
+    assert list(nntp_client.pipeline(commands, depth=1)) == [
+        (211, "1 1 1 a"),
+        (411, "no such group"),
+        (211, "1 1 1 c"),
+    ]
+    assert connect.return_value.sent == b"GROUP a\r\nGROUP bad\r\nGROUP c\r\n"
+
+
+def test_pipeline_break(connect: mock.MagicMock) -> None:
+    nntp_client = client(
+        connect,
+        b"211 1 1 1 a\r\n",
+        b"411 no such group\r\n211 1 1 1 c\r\n",
+    )
+    commands = [("GROUP", "a"), ("GROUP", "bad"), ("GROUP", "c")]
+    for code, _ in nntp_client.pipeline(commands):
+        if code == 411:
+            break
+    with pytest.raises(NNTPSyncError):
+        nntp_client.command("STAT", "1")
+
+
+def test_pipeline_generating(connect: mock.MagicMock) -> None:
+    nntp_client = client(
+        connect,
+        b"211 1 1 1 a\r\n",
+        b"224 overview\r\n1\tx\r\n2\ty\r\n.\r\n223 1 <a@b>\r\n",
+    )
+    commands = [("GROUP", "a"), ("XOVER", "1-"), ("STAT", "1")]
+    replies = nntp_client.pipeline(commands)
+    next(replies)
+    code, message = next(replies)
+    next(nntp_client.info(code, message))
+    with pytest.raises(NNTPSyncError, match="generator"):
+        next(replies)
+
+
+def test_pipeline_protocol_error(connect: mock.MagicMock) -> None:
+    nntp_client = client(connect, b"211 1 1 1 a\r\n", b"garbage\r\n")
+    commands = [("GROUP", "a"), ("GROUP", "b"), ("GROUP", "c")]
+    with pytest.raises(NNTPProtocolError):
+        list(nntp_client.pipeline(commands))
+    with pytest.raises(NNTPSyncError, match="pipeline failed"):
+        nntp_client.command("STAT", "1")
+
+
+def test_pipeline_commands_error(connect: mock.MagicMock) -> None:
+    def commands() -> Iterator[tuple[str, str]]:
+        yield "GROUP", "a"
+        yield "GROUP", "b"
+        raise RuntimeError
+
+    nntp_client = client(connect, b"211 1 1 1 a\r\n", b"211 1 1 1 b\r\n")
+    with pytest.raises(RuntimeError):
+        list(nntp_client.pipeline(commands(), depth=1))
+    with pytest.raises(NNTPSyncError, match="pipeline failed"):
+        nntp_client.command("STAT", "1")
+
+
+@pytest.mark.parametrize("depth", [0, -1])
+def test_pipeline_depth(connect: mock.MagicMock, depth: int) -> None:
+    nntp_client = client(connect)
+    with pytest.raises(ValueError, match="depth"):
+        next(nntp_client.pipeline([("GROUP", "a")], depth=depth))
+    assert connect.return_value.sent == b""
+
+
+def test_info_gzip_trailing_lines(connect: mock.MagicMock) -> None:
+    # more than one inflate chunk follows the terminator
+    data = gzip.compress(b"one\r\n.\r\n" + b"ignored\r\n" * 0x4000)
+    nntp_client = client(
+        connect, b"224 overview [COMPRESS=GZIP]\r\n" + data, b"223 1 <a@b>\r\n"
+    )
+    code, message = nntp_client.command("XOVER", "1-")
+    assert list(nntp_client.info(code, message)) == ["one\r\n"]
+    assert nntp_client.command("STAT", "1") == (223, "1 <a@b>")
+
+
+def test_info_plain(connect: mock.MagicMock) -> None:
+    nntp_client = client(
+        connect, b"224 overview\r\none\r\n..two\r\n...three\r\n.\r\n223 1 <a@b>\r\n"
+    )
+    code, message = nntp_client.command("XOVER", "1-")
+    assert list(nntp_client.info(code, message)) == [
+        "one\r\n",
+        ".two\r\n",
+        "..three\r\n",
+    ]
+    assert nntp_client.command("STAT", "1") == (223, "1 <a@b>")
+
+
+def test_info_gzip_terminator_inside(connect: mock.MagicMock) -> None:
+    data = gzip.compress(b"one\r\n..two\r\n.\r\n")
+    nntp_client = client(
+        connect, b"224 overview [COMPRESS=GZIP]\r\n" + data, b"223 1 <a@b>\r\n"
+    )
+    code, message = nntp_client.command("XOVER", "1-")
+    assert list(nntp_client.info(code, message)) == ["one\r\n", ".two\r\n"]
+    assert nntp_client.command("STAT", "1") == (223, "1 <a@b>")
+
+
+def test_info_gzip_terminator_after(connect: mock.MagicMock) -> None:
+    # the reply to the next command arrives along with the terminator
+    data = gzip.compress(b"one\r\n..two\r\n")
+    nntp_client = client(
+        connect,
+        b"224 overview [COMPRESS=GZIP]\r\n" + data[:10],
+        data[10:] + b".\r\n223 1 <a@b>\r\n",
+    )
+    code, message = nntp_client.command("XOVER", "1-")
+    assert list(nntp_client.info(code, message)) == ["one\r\n", ".two\r\n"]
+    assert nntp_client.command("STAT", "1") == (223, "1 <a@b>")
+
+
+def test_xpat(connect: mock.MagicMock) -> None:
+    reply = b"221 matches\r\n1 caf\xc3\xa9\xe2\x80\x83\r\n.\r\n"
+    connect.return_value = FakeSocket([b"200 ready\r\n", reply, reply])
+    nntp_client = NNTPClient("localhost", reader=False)
+    assert list(nntp_client.xpat_raw("Subject", (1,), "*", "x*")) == [
+        b"1 caf\xc3\xa9\xe2\x80\x83\r\n"
+    ]
+    assert list(nntp_client.xpat("Subject", (1,), "*", "x*")) == ["1 caf\xe9"]
+    assert connect.return_value.sent == b"XPAT Subject 1- * x*\r\n" * 2
+
+
+def test_info_gzip_split_header(connect: mock.MagicMock) -> None:
+    data = gzip.compress(b"one\r\n.\r\n")
+    nntp_client = client(
+        connect,
+        b"224 overview [COMPRESS=GZIP]\r\n" + data[:1],
+        data[1:],
+        b"223 1 <a@b>\r\n",
+    )
+    code, message = nntp_client.command("XOVER", "1-")
+    assert list(nntp_client.info(code, message)) == ["one\r\n"]
+    assert nntp_client.command("STAT", "1") == (223, "1 <a@b>")
+
+
+def test_xover_multi_invalid_range(connect: mock.MagicMock) -> None:
+    connect.return_value = FakeSocket([b"200 ready\r\n", b"223 1 <a@b>\r\n"])
+    nntp_client = NNTPClient("localhost", reader=False)
+    ranges = [*[(n,) for n in range(17)], None]
+    with pytest.raises(ValueError, match="integer or tuple"):
+        next(nntp_client.xover_multi(ranges))  # type: ignore[arg-type]
+    assert connect.return_value.sent == b""
+    assert nntp_client.command("STAT", "1") == (223, "1 <a@b>")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from io import StringIO
 from typing import TYPE_CHECKING
 
@@ -11,6 +11,7 @@ from nntp.utils import (
     parse_epoch,
     parse_headers,
     parse_newsgroup,
+    unparse_date,
     unparse_msgid_range,
     unparse_range,
 )
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
 @pytest.mark.parametrize(
     ("range", "expected"),
     [
+        (4678, "4678"),
         ((1, 10), "1-10"),
         ((100,), "100-"),
         pytest.param(None, None, marks=pytest.mark.xfail(raises=ValueError)),
@@ -37,6 +39,8 @@ def test_unparse_range(range: Range, expected: str) -> None:  # noqa: A002
     ("msgid_range", "expected"),
     [
         ("msgid1", "msgid1"),
+        ("<msgid1@example.com>", "<msgid1@example.com>"),
+        (4678, "4678"),
         ((1, 10), "1-10"),
         ((100,), "100-"),
         pytest.param(None, None, marks=pytest.mark.xfail(raises=ValueError)),
@@ -55,6 +59,7 @@ def test_unparse_msgid_range(msgid_range: str | Range, expected: str) -> None:
         ("local.test 0 1 n", ("local.test", 0, 1, "n")),
         ("alt.test 10 20 y", ("alt.test", 10, 20, "y")),
         ("alt.test\t10\t20 ?", ("alt.test", 10, 20, "?")),
+        ("alt.test 10 20 y extra\r\n", ("alt.test", 10, 20, "y")),
         pytest.param("alt.test", None, marks=pytest.mark.xfail(raises=ValueError)),
         pytest.param("alt.test 10", None, marks=pytest.mark.xfail(raises=ValueError)),
         pytest.param(
@@ -120,6 +125,22 @@ def test_parse_date(date: str | int, expected: datetime) -> None:
     assert parse_date(date) == expected
 
 
+@pytest.mark.parametrize(
+    ("date", "expected"),
+    [
+        (datetime(2022, 1, 1, 14, 40, 1), "20220101 144001 GMT"),  # noqa: DTZ001
+        (datetime(2022, 1, 1, 14, 40, 1, tzinfo=timezone.utc), "20220101 144001 GMT"),
+        (
+            datetime(2022, 1, 2, 0, 40, 1, tzinfo=timezone(timedelta(hours=10))),
+            "20220101 144001 GMT",
+        ),
+        (datetime(999, 1, 1), "09990101 000000 GMT"),  # noqa: DTZ001
+    ],
+)
+def test_unparse_date(date: datetime, expected: str) -> None:
+    assert unparse_date(date) == expected
+
+
 @pytest.mark.parametrize(
     ("epoch", "expected"),
     [
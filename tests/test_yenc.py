@@ -1,3 +1,4 @@
+import zlib
 from pathlib import Path
 
 import pytest
@@ -39,3 +40,20 @@ def test_decode(yenc1_plain: bytes, yenc1_encoded: bytes) -> None:
         plain += decoder.decode(line)
     assert plain == yenc1_plain
     assert decoder.crc32 == 0xDED29F4F
+
+
+@pytest.mark.parametrize(
+    ("chunks", "expected"),
+    [
+        ([b"ab\r\n"], b"78"),
+        ([b"a=}b\r\n"], b"7\x138"),
+        ([b"ab=", b"}\r\n"], b"78\x13"),
+        ([b"ab=\r\n", b"}b\r\n"], b"78\x138"),
+        ([b"a==b\r\n"], b"7\xd38"),
+        ([b"a=", b"=b\r\n"], b"7\xd38"),
+    ],
+)
+def test_decode_escape(chunks: list[bytes], expected: bytes) -> None:
+    decoder = YEnc()
+    assert b"".join(decoder.decode(chunk) for chunk in chunks) == expected
+    assert decoder.crc32 == zlib.crc32(expected)